@@ -2,55 +2,85 @@ from dmx import DMX_RX
 from fire import led_panel
 import utime
 import _thread
+import uctypes
+from micropython import const
 
 import machine
 
-import gc
-
-brightness = 0
-red = 1
-green = 2
-blue = 3
-fade = 4
-speed = 5
+_DEBUG = const(0)   # Set to 1 to print the values handled on every frame - this allocates, so can trigger a GC in the loops
+
+# Latest fixture values from DMX, written by the DMX reader on core 1 and read by the LED effect on core 0
+FIXTURE_LAYOUT = {
+    "brightness":   0 | uctypes.UINT8,
+    "red":          1 | uctypes.UINT8,
+    "green":        2 | uctypes.UINT8,
+    "blue":         3 | uctypes.UINT8,
+    "fade":         4 | uctypes.UINT8,
+    "speed":        5 | uctypes.UINT8,
+}
+state = bytearray(6)
+shared = uctypes.struct(uctypes.addressof(state), FIXTURE_LAYOUT)
 thread_running = True
 
 
+@micropython.viper                                      # type: ignore
+def sample(src: ptr8, dst: ptr8, start: int):           # type: ignore
+    # Copy the six fixture channels starting at src[start] into dst
+    for i in range(6):
+        dst[i] = src[start + i]
+
+
 def dmx_test():
     # Initialise the DMX receiver
     dmx_start_channel = 128
-    dmx_in = DMX_RX(pin=28)  # DMX data should be presented to GPIO28 (Pico pin 34)
+    dmx_in = DMX_RX(pin=28, num_channels=dmx_start_channel + 4)  # DMX data should be presented to GPIO28 (Pico pin 34)
     dmx_in.start()
 
-    last_frame = -1
+    # Hoist lookups out of the loop - channels/buffer() can't be, as they change with every frame
+    wait_frame = dmx_in.wait_frame
+    dmx_end_channel = dmx_start_channel + 5
 
     while True:
-        current_frame = dmx_in.frames_received
+        wait_frame()
 
-        if current_frame != last_frame:
-            print(f"Ch:{dmx_start_channel} Rx:", end="")
-            for n in range(5):
-                print(f"{dmx_in.channels[dmx_start_channel + n]:3}  ", end="")
-            print(f" Frames Rxd:{current_frame}")
-            last_frame = current_frame
+        print(f"Ch:{dmx_start_channel} Rx:", end="")
+        for value in dmx_in.buffer()[dmx_start_channel:dmx_end_channel]:
+            print(f"{value:3}  ", end="")
+        print(f" Frames Rxd:{dmx_in.frames_received}")
 
 
 def fire_test():
     # Initialise the firelight effect
     firelight = led_panel(pin=27, leds=50)
+    update = firelight.update
 
     while True:
-        firelight.update(brightness=255, fade=64, speed=64)
+        update(brightness=255, fade=64, speed=64)
 
 
 def firelight():
     # Initialise the firelight effect
     firelight = led_panel(pin=27, leds=50)
+    update = firelight.update
+
+    while thread_running:
+        if _DEBUG:
+            print(f"Perform  fader:{shared.brightness}  R:{shared.red} G:{shared.green} B:{shared.blue}")
+        update(brightness=shared.brightness, red=shared.red, green=shared.green, blue=shared.blue, fade=shared.fade, speed=shared.speed)
+
+
+def dmx_reader(dmx_in, dmx_start):
+    # Copy each frame's fixture channels into the shared state - runs on core 1
+    wait_frame = dmx_in.wait_frame
+    copy_channels = sample
 
     while thread_running:
-        print(f"Perform  fader:{brightness}  R:{red} G:{green} B:{blue}")
-        firelight.update(brightness=brightness, red=red, green=green, blue=blue, fade=fade, speed=speed)
-        # gc.collect()
+        if not wait_frame(100):                         # Time out now and then to notice thread_running being cleared
+            continue
+        copy_channels(dmx_in.buffer(), state, dmx_start)
+
+        if _DEBUG:
+            print(f"Received fader:{shared.brightness}  R:{shared.red} G:{shared.green} B:{shared.blue} B:{shared.fade} B:{shared.speed}")
     print("Thread exiting")
 
 
@@ -68,40 +98,13 @@ def test_both():
     # Initialise the DMX receiver
     dmx_start = 0
 
-    dmx_in = DMX_RX(pin=28, statemachine=1)  # DMX data should be presented to GPIO28 (Pico pin 34)
+    dmx_in = DMX_RX(pin=28, statemachine=1, num_channels=dmx_start + 5)  # DMX data should be presented to GPIO28 (Pico pin 34)
     dmx_in.start()
-    last_frame = -1
-    last_frame_data = ""
 
     try:
-        # Start the firelight as a second thread
-        # _thread.start_new_thread(firelight, ())
-
-        while True:
-            global brightness
-            global red
-            global green
-            global blue
-            global fade
-            global speed
-
-            brightness = dmx_in.channels[dmx_start + 0]
-            red = dmx_in.channels[dmx_start + 1]
-            green = dmx_in.channels[dmx_start + 2]
-            blue = dmx_in.channels[dmx_start + 3]
-            fade = dmx_in.channels[dmx_start + 4]
-            speed = dmx_in.channels[dmx_start + 5]
-
-            current_frame = dmx_in.frames_received
-
-            if (current_frame != last_frame):
-                last_frame = current_frame
-                print(f"Received fader:{brightness}  R:{red} G:{green} B:{blue} B:{fade} B:{speed}")
-
-            # current_frame_data = str(dmx_in)
-            # if last_frame_data != current_frame_data:
-            #     last_frame_data = current_frame_data
-            #     print(current_frame_data)
+        # Receive DMX on the second core, leaving this one free to drive the LEDs
+        _thread.start_new_thread(dmx_reader, (dmx_in, dmx_start))
+        firelight()
 
     except:
         global thread_running
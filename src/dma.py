@@ -46,6 +46,12 @@ TREQ_XIP_STREAM = 37
 TREQ_XIP_SSITX  = 38
 TREQ_XIP_SSIRX  = 39
 
+TREQ_TIMER0     = 59
+TREQ_TIMER1     = 60
+TREQ_TIMER2     = 61
+TREQ_TIMER3     = 62
+TREQ_PERMANENT  = 63                                # Unpaced - transfer as fast as possible
+
 class DmaChannel:
     def __init__(self, channelNumber):
         offset = channelNumber * 0x40
@@ -56,6 +62,9 @@ class DmaChannel:
         self.TransferCountRegister  = 0x50000008 + offset
         self.TriggerControlRegister = 0x5000000C + offset
         self.ControlRegister        = 0x50000010 + offset
+        self.WriteTriggerRegister   = 0x5000002C + offset   # AL2_WRITE_ADDR_TRIG - writing here sets the write address and triggers the channel
+        self.ReadTriggerRegister    = 0x5000003C + offset   # AL3_READ_ADDR_TRIG - writing here sets the read address and triggers the channel
+        self.AbortRegister          = 0x50000444            # CHAN_ABORT - shared by all channels, one bit each
 
         self.ControlValue = 0x003F8033 + (channelNumber << 11) # Enable, Hi-priority, Bytes, no chain-to, increment both read and write, no IRQs, no ring
         # Bit 31302928 27262524 23222120 19181716 15141312 11100908 07060504 03020100          
@@ -118,6 +127,34 @@ class DmaChannel:
         ptr= ptr32(self.TriggerControlRegister)    # type: ignore
         ptr[0] = uint(self.ControlValue)           # type: ignore
         
+    @micropython.viper                             # type: ignore
+    def Rearm(self, address: uint):                # type: ignore
+        # Restart the channel writing to a new address - the control value, read address and transfer count already
+        # loaded are re-used, so this is a single register write
+        ptr = ptr32(self.WriteTriggerRegister)     # type: ignore
+        ptr[0] = address
+
+    @micropython.viper                             # type: ignore
+    def Busy(self) -> bool:
+        # BUSY (bit 24 of the control register) is set while the channel has transfers outstanding
+        ptr = ptr32(self.ControlRegister)          # type: ignore
+        return (ptr[0] & 0x01000000) != 0
+
+    @micropython.viper                             # type: ignore
+    def Disable(self):
+        # Clear the control register (including EN) so the channel ignores triggers. ControlValue is kept for re-enabling.
+        ptr = ptr32(self.ControlRegister)          # type: ignore
+        ptr[0] = 0
+
+    @micropython.viper                             # type: ignore
+    def Abort(self):
+        # Abandon any transfers in progress, and wait until the channel is idle
+        mask = 1 << int(self.ChannelNumber)        # type: ignore
+        ptr = ptr32(self.AbortRegister)            # type: ignore
+        ptr[0] = mask
+        while ptr[0] & mask:
+            pass
+
     def SetChainTo(self, chainNumber : uint):      # type: ignore
         self.ControlValue  &= ~ 0x7800
         self.ControlValue |= (chainNumber <<11)
@@ -130,7 +167,8 @@ class DmaChannel:
         self.ControlValue |= 0x4
         
     def SetWordTransfer(self):
-        self.ControlValue |= 0xC
+        self.ControlValue  &= ~ 0xC
+        self.ControlValue |= 0x8
     
     def SetReadIncr(self):
         # Read address increments when bit 4 of the control value is set
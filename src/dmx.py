@@ -1,5 +1,10 @@
 import rp2                            # type: ignore
-from machine import Pin, Timer        # type: ignore
+import _thread                        # type: ignore
+import micropython                    # type: ignore
+from micropython import const         # type: ignore
+import utime                          # type: ignore
+from array import array
+from machine import Pin, idle         # type: ignore
 
 from uctypes import addressof         # type: ignore
 
@@ -18,7 +23,7 @@ import dma
 #     Put simply, the class sets up the DMA and PIO and then provides a convenient interface to the bytearray used by the
 #     DMA controller. Setting or reading individual channels is permitted, as is reading/writing the entire Universe. 
 # 
-#     When used as a transmitter, the class uses DMA and PIO to repeatedly send the universe based upon a timer. 
+#     When used as a transmitter, the class uses chained DMA channels and PIO to repeatedly send the universe. 
 #     When used as a receiver, each received universe is copied and made available to the user as soon as it is received.
 
 # DMA Channel and PIO allocations:
@@ -40,25 +45,100 @@ import dma
 #
 # DMX timing: https://support.etcconnect.com/ETC/FAQ/DMX_Speed
 
+_DMX_DEBUG          = const(0)                      # 1 to drive the DMX_RX debug pins (12 + 13) from the PIO
+
+_PIO0_TXF0          = const(0x50200010)             # PIO0 TX FIFO for statemachine 0
+_PIO0_RXF1_BYTE3    = const(0x50200027)             # PIO0 RX FIFO for statemachine 1, +3 to get the LSB byte without shifting
+
+_START_CODE_LABEL = b"Start code: "
+
+def _str_size(num_channels, width):
+    """ Length of the text _format_universe() produces for num_channels data channels of the given field width """
+    return (len(_START_CODE_LABEL) + 4                  # Start code (up to 3 digits) and its newline
+            + 5 * ((num_channels + 19) // 20)           # "\nNNN:" every 20 channels
+            + 2 * ((num_channels + 4) // 5)             # Spaces every five channels
+            + width * num_channels                      # The channel values themselves
+            + num_channels // 100                       # Blank line every 100 channels
+            + 1)                                        # Final newline
+
+def _put_int(buf, pos, value, width, fill):
+    # Right-justify value into buf[pos:pos+width], padded with the fill character. Returns the position after the field.
+    end = pos + width
+    i = end - 1
+    buf[i] = 0x30 + value % 10
+    value //= 10
+    while i > pos:
+        i -= 1
+        if value:
+            buf[i] = 0x30 + value % 10
+            value //= 10
+        else:
+            buf[i] = fill
+    return end
+
+def _format_universe(channels, buf, width):
+    """ Render a universe into the preallocated buffer buf (a memoryview) without building intermediate strings
+
+    Args:
+        channels (bytearray):   The universe, start code first
+        buf (memoryview):       Scratch space of at least _str_size(len(channels)-1, width) bytes
+        width (int):            Field width for each channel value
+
+    Returns:
+        str: The formatted universe
+    """
+    start_code = channels[0]                            # The start code ("channel zero") is formatted differently
+    pos = len(_START_CODE_LABEL)
+    buf[0:pos] = _START_CODE_LABEL
+    pos = _put_int(buf, pos, start_code, 1 + (start_code >= 10) + (start_code >= 100), 0x20)
+    buf[pos] = 0x0A
+    pos += 1
+
+    for chan in range(1, len(channels)):
+        if chan % 20 == 1:                              # Start a new line with the channel number every 20 lines
+            buf[pos] = 0x0A
+            pos = _put_int(buf, pos + 1, chan, 3, 0x30)
+            buf[pos] = 0x3A
+            pos += 1
+
+        if chan % 5 == 1:                               # Put spaces into the line every five channels
+            buf[pos] = 0x20
+            buf[pos + 1] = 0x20
+            pos += 2
+
+        pos = _put_int(buf, pos, channels[chan], width, 0x20)
+
+        if chan % 100 == 0:                             # Blank line every 100 channels
+            buf[pos] = 0x0A
+            pos += 1
+
+    buf[pos] = 0x0A
+    return str(buf[:pos + 1], "ascii")
+
+_TX_FRAME_US    = const(196)                            # dmx_out time per frame excluding the gap and data: setup, BREAK and MAB
+_TX_BYTE_US     = const(45)                             # dmx_out time per byte: pull, START, 8 data bits, STOP bits
+_TX_GAP_US      = const(8)                              # dmx_out time per gap loop
+
 class DMX_TX:
     """ Interface to a DMX universe for sending using a PIO module.
     Transmission:
         A DMA channel is set up to copy a bytearray (address automatically incrementing on each transfer) into the PIO FIFO 
-        (at a fixed address). When this transfer completes, the DMA channel raises an interrupt and the handler resets both the 
-        PIO and the DMA channel. When restarted, the PIO first ensures that the DMX "break" is sent, then the 
-        MarkAfterBreak, before streaming out the bytes as sent by the DMA into its FIFO. As the PIO completes each byte, a 
-        Data Request (DREQ) interrupt is raised to start the next DMA transfer. The need to send the Break and MAB by resetting
-        the PIO are the reason we can't just chain two DMA channels together where the second channel simply reloads the first.
-
-        1. PIO sends Break and half of the MAB - the second half of the MAB comes from the stop bits which are sent next
-        2. PIO then pulls data from the DMA, triggering a DREQ, and sends the stop bits (8us), the start bit (4us), then 8 data bits. 
-        2. Upon receipt of the DREQ, DMA sends the next byte to the PIO input FIFO
-        3. When the entire Universe has been DMA'd, the DMA raises a processor interrupt
-        4. When the DMA interrupt is received, the processor resets the PIO and restarts the DMA 
+        (at a fixed address). When this transfer completes, it chains to a second "reload" DMA channel which writes the address of
+        the bytearray back into the first channel's READ_ADDR_TRIG register, restarting it. The PIO is told the frame length once
+        at start up and counts the bytes itself, so it sends the DMX "break" and MarkAfterBreak at the start of every frame 
+        without being reset. As the PIO takes each byte, a Data Request (DREQ) is raised to start the next DMA transfer. 
+        Once started, frames are sent with no processor involvement at all - the PIO counts its own clock cycles between frames
+        so the frame rate is as steady as the PIO clock.
+
+        1. PIO waits for the rest of the frame period, then sends Break and MAB
+        2. PIO then pulls data from the DMA, triggering a DREQ, and sends the start bit (4us), 8 data bits, then the stop bits (8us)
+        3. Upon receipt of the DREQ, DMA sends the next byte to the PIO input FIFO
+        4. When the entire Universe has been DMA'd, the data DMA channel chains to the reload channel, which restarts it
+        5. When the PIO has sent the whole frame it loops back to step 1
     """
-    from dmx_asm import dmx_out
+    from dmx_prog import dmx_out
 
-    def __init__(self, pin, universe_size=512, statemachine=0, dmachannel=0):
+    def __init__(self, pin, universe_size=512, statemachine=0, dmachannel=0, reload_dmachannel=3):
         """ Initialisation of the DMX controller PIO statemachine and DMA channel
 
         Args:
@@ -66,17 +146,18 @@ class DMX_TX:
             universe_size (int, optional):  Size of the DMX universe to interface to. Defaults to 512.
             statemachine (int, optional):   Which PIO statemachine should be used. Defaults to 0.
             dmachannel (int, optional):     Which DMA channel should be used. Defaults to 0.
+            reload_dmachannel (int, optional): Which DMA channel should be used to restart dmachannel. Defaults to 3.
 
         Raises:
             ValueError: Any invalid parameters are reported as exceptions
 
         TODO: Allow the interbyte delay to be specified
-        TODO: Allow the inter-packet delay to be specified (or is the rate good enough?)
         """
         if universe_size < 1 or universe_size > 512:
             raise ValueError("DMX universes must have 1...512 channels")
         
-        self.channels       = bytearray([0 for _ in range(universe_size+1)]) # +1 because DMX-0 is the start code, with channels 1-512 behind it
+        self.channels       = bytearray(universe_size+1) # +1 because DMX-0 is the start code, with channels 1-512 behind it
+        self._strbuf        = memoryview(bytearray(_str_size(universe_size, 4)))   # Reused by __str__ so printing doesn't churn the heap
 
         self._pin           = Pin(pin, Pin.OUT, Pin.PULL_UP)
         self._sm            = rp2.StateMachine(statemachine, 
@@ -85,29 +166,51 @@ class DMX_TX:
                                                sideset_base=self._pin, 
                                                out_base=self._pin)
         self._dma           = dma.DmaChannel(dmachannel)
+        self._reload        = dma.DmaChannel(reload_dmachannel)
+        self._reload_addr   = array('I', [addressof(self.channels)])  # Source for the reload channel
 
         # Set up the DMA controller
         self._dma.NoWriteIncr()
-        self._dma.SetTREQ(0) # TODO - hard coded as PIO0 TX0
+        self._dma.SetTREQ(dma.TREQ_PIO0_TX) # TODO - hard coded as PIO0 TX0
+        self._dma.SetChainTo(reload_dmachannel)
+
+        # A single, unpaced word copied into the data channel's READ_ADDR_TRIG register
+        self._reload.SetWordTransfer()
+        self._reload.NoReadIncr()
+        self._reload.NoWriteIncr()
+        self._reload.SetTREQ(dma.TREQ_PERMANENT)
 
     def start(self, period = 50):
         """ Start sending DMX packets
 
         Args:
-            period (int, optional): Start sending a new packet every period milliseconds. Defaults to 50.
+            period (int, optional): Start sending a new packet every period milliseconds. Defaults to 50. Packets which take 
+                                    longer than this to send are sent back to back.
+
+        Raises:
+            ValueError: The period is longer than the PIO's 16 bit gap counter can wait - about 524ms plus the frame time
         """
-        self.timer_count = 0
-        self.t = Timer(period=period, callback=self.restart)
+        gap = (period * 1000 - _TX_FRAME_US - _TX_BYTE_US * len(self.channels)) // _TX_GAP_US - 1
+        if gap > 0xFFFF:
+            raise ValueError("DMX period too long for the PIO gap counter")
+        gap = max(gap, 0)
+
+        self._sm.restart()
+        self._sm.put((len(self.channels)-1) << 16 | gap)   # Set the length of the DMX frame to send and the gap between frames
+        self._sm.active(1)
+
+        # Arm the reload channel without triggering it - it is started by the chain from _dma
+        self._reload.SetChannelData(addressof(self._reload_addr), self._dma.ReadTriggerRegister, 1, False)
+        self._reload.SetControlRegister(self._reload.ControlValue)
+        self._dma.SetChannelData(addressof(self.channels), _PIO0_TXF0, len(self.channels), True) # TODO Hard coded as PIO0 for now
 
     def pause(self):
-        self.t.deinit()
+        # Stop the reload channel responding to the chain first, so the data channel can't be restarted once aborted
+        self._reload.Disable()
+        self._dma.Abort()
         self._sm.active(0)
-
-    def restart(self, t):
-        self._sm.active(1)
-        self._sm.restart()
-        self._dma.SetChannelData(addressof(self.channels), 0x50200010, len(self.channels), True) # TODO Hard coded as PIO0 for now
-        self.timer_count += 1
+        while self._sm.tx_fifo():             # Throw away the start of the next frame rather than sending it - start() restarts the PIO
+            self._sm.exec("pull(noblock)")
    
     def __del__(self):
         # TODO - tidy up the state machine and DMA channels
@@ -118,38 +221,34 @@ class DMX_TX:
         pass
 
     def __str__(self):
-        result = ""
-        for chan in range(len(self.channels)):
-            if chan % 20 == 1:
-                result += f"\n{chan:03}:"                      # Start a new line with the channel number every 20 lines
-            
-            if chan % 5 == 1:
-                result += "  "                                 # Put spaces into the line every five channels
-            
-            if chan == 0:
-                result = f"Start code: {self.channels[chan]}"  # The start code ("channel zero") is formatted differently
-            else:
-                result += f" {self.channels[chan]:3}"
-            
-            if chan % 100 == 0:                                # Blank line every 100 channels
-                result += "\n"
-        
-        result += "\n"
-        return result
+        return _format_universe(self.channels, self._strbuf, 4)
+
+@micropython.viper                                      # type: ignore
+def _count_frame(counter: ptr32):                       # type: ignore
+    # Increment a 32 bit counter in place - no integer boxing, so safe to call from a hard interrupt
+    counter[0] = counter[0] + 1
+
 class DMX_RX:
     """
     Class basics:
-        Set up one channel of DMA and one PIO to receive DMX frames of the specified (or shorter) length, and provide a convenient
-        interface to a bytearray containing the values received. Reading individual channels is permitted, as is reading the entire 
-        Universe. 
+        Set up two chained channels of DMA and one PIO to receive DMX frames of the specified (or shorter) length, and provide a 
+        convenient interface to a bytearray containing the last complete frame received. Reading individual channels is permitted, 
+        as is reading the entire Universe. 
+
+        The DMA channels ping-pong between two bytearrays, so `channels` (and the memoryview returned by `buffer()`) refers to a 
+        different bytearray after every frame - re-read `channels` for each frame rather than holding on to it. The DMA doesn't write to the
+        bytearray in `channels` again until the following frame has been received, so a frame can be processed in place without 
+        copying it, as long as that finishes within one frame period.
 
     Caution:    
         There is a small race condition in that IF a short frame is received AND there is a relatively short BREAK, the processor 
-        may not have handled the PIO interrupt (6b) fully before the BREAK has finished causing data corruption.
+        may not have handled the PIO interrupt (6b) fully before the BREAK has finished causing data corruption. Full length
+        frames are not affected as the DMA rearms itself in hardware - so set num_channels to no more than the number of channels
+        actually being sent, ideally just the channels needed. Anything beyond num_channels in a longer frame is ignored.
 
     How it works:
         A PIO is constantly watching the DMX input pin. Once a valid Break and MarkAfterBreak are observed, subsequent 8N2 
-        bytes are passed to the PIO FIFO which is read by the DMA channel and copied into the bytearray.
+        bytes are passed to the PIO FIFO which is read by the active DMA channel and copied into its bytearray.
 
         1. The PIO waits for a very long run of zeros (92us or more - Break)
         2. The PIO waits for a one (any length - MAB) - there is no check that this is longer than then minimum length (12us)
@@ -157,60 +256,144 @@ class DMX_RX:
         4. The PIO captures 8 bits, one every 4us, and shifts these into the ISR
         5. The PIO waits for a one (stop bit), and sends the ISR to the DMA
         6a. If a full frame has NOT yet been received, the PIO loops back to step 3 - there is no check that the stop bit is the correct length (8us)
-        6b. If a full frame HAS been received, the PIO causes a processor interrupt, the handler for which resets the DMA. The PIO is already back at step 1.
+        6b. If a full frame HAS been received, the PIO causes a processor interrupt, the handler for which publishes the bytearray just 
+            filled as `channels`. The PIO is already back at step 1.
          
-        The DMA accepts each byte from the PIO and stores it in memory. If too many bytes are received (should be impossible), the DMA stops
+        The DMA accepts each byte from the PIO and stores it in memory. Once the whole frame has been stored, the DMA channel chains 
+        to its sibling which is already set up to receive the next frame into the other bytearray - no processor involvement is 
+        needed. The interrupt handler then points the idle channel back at the start of its bytearray ready for its next turn.
+
+        If a short frame is received the DMA never completes, so the interrupt handler aborts it and starts the sibling by hand.
 
     DMA Channel and PIO allocations:
         It is not possible to check the hardware to see if a DMA channel or PIO statemachine is already in use. No extra locking
         has been added in this software, thus clashes need to be avoided by the user code.
     """
 
-    from dmx_asm import dmx_in
+    from dmx_prog import dmx_in, dmx_in_debug
 
-    def __init__(self, pin, statemachine=4, dmachannel=1, num_channels=512):
+    def __init__(self, pin, statemachine=4, dmachannel=1, num_channels=512, chain_dmachannel=2):
         """ Initialisation of the DMX controller
 
         Args:
             pin (numeric):                  Pin number to use
             statemachine (int, optional):   Which PIO statemachine should be used. Defaults to 4.
             dmachannel (int, optional):     Which DMA channel should be used. Defaults to 1.
-            num_channels (int, optional):   The number of DMX channels expected. Defaults to 512. 
+            num_channels (int, optional):   The number of DMX channels to receive, 1...512. Defaults to 512. 
+            chain_dmachannel (int, optional): Which DMA channel should be chained with dmachannel. Defaults to 2.
             
-            Note that if shorter frames are being received AND the DMX BREAK is close to the minimum permitted, a race condition exists which may cause
-            data corruption.
+            Only channels 1...num_channels of each frame are received, any further channels are ignored. Receiving just the 
+            channels needed uses less memory, and the frame is complete (and the DMA rearmed) as soon as the last of them arrives,
+            well before the next BREAK.
+
+            Note that if frames shorter than num_channels are being received AND the DMX BREAK is close to the minimum permitted, 
+            a race condition exists which may cause data corruption.
 
         Raises:
             ValueError: Any invalid parameters are reported as exceptions
         """
-        self.channels   = bytearray([0 for _ in range(num_channels+1)]) # DMX-0 is the start code, with channels 1-512 behind it
+        if num_channels < 1 or num_channels > 512:
+            raise ValueError("DMX universes must have 1...512 channels")
+
+        # Two frame buffers - DMA fills _buffers[_active] while the other holds the last complete frame
+        self._buffers   = (bytearray(num_channels+1), bytearray(num_channels+1)) # DMX-0 is the start code, with channels 1-512 behind it
+        self._views     = tuple(memoryview(buffer) for buffer in self._buffers)
+        self._addrs     = tuple(addressof(buffer) for buffer in self._buffers)
+        self._active    = 0
+        self.channels   = self._buffers[1]              # The last complete frame
+        self._view      = self._views[1]                # Returned by buffer() - slice it to copy out several channels at once
+        self._strbuf    = memoryview(bytearray(_str_size(num_channels, 3)))     # Reused by __str__ so printing doesn't churn the heap
         
         self._pin       = Pin(pin, Pin.IN)
 
-        self._debugpin  = Pin(12, Pin.OUT, Pin.PULL_UP) # TODO Temporary hard coded debug pins (12 + 13 used)
-
-        self._sm = rp2.StateMachine(statemachine, 
-                                    prog=DMX_RX.dmx_in, 
-                                    freq=1_000_000,
-                                    in_base=self._pin, 
-                                    jmp_pin=self._pin,
-                                    sideset_base=self._debugpin)
-        self._sm.irq(handler=self.IRQ_from_PIO)
-        self.frames_received = 0
+        if _DMX_DEBUG:
+            self._debugpin = Pin(12, Pin.OUT, Pin.PULL_UP) # TODO Temporary hard coded debug pins (12 + 13 used)
+
+            self._sm = rp2.StateMachine(statemachine, 
+                                        prog=DMX_RX.dmx_in_debug, 
+                                        freq=1_000_000,
+                                        in_base=self._pin, 
+                                        jmp_pin=self._pin,
+                                        sideset_base=self._debugpin)
+        else:
+            self._sm = rp2.StateMachine(statemachine, 
+                                        prog=DMX_RX.dmx_in, 
+                                        freq=1_000_000,
+                                        in_base=self._pin, 
+                                        jmp_pin=self._pin)
+        self._frames    = array('I', [0])               # Frame counter, updated in place by the interrupt handler
+
+        # Held while no new frame is waiting - released (via the scheduler) by the PIO interrupt, acquired by wait_frame()
+        self._frame_lock = _thread.allocate_lock()
+        self._frame_lock.acquire()
+        self._notify_ref = self._notify                 # Bound once here so the interrupt handler doesn't allocate
+        self._notify_pending = False                    # Set while a _notify is queued, so frames can't flood the schedule queue
+        self._sm.irq(handler=self.IRQ_from_PIO, hard=True)
         
-        self._dma = dma.DmaChannel(dmachannel)
-        self._dma.NoReadIncr()
-        self._dma.SetTREQ(dma.TREQ_PIO1_RX) # TODO hard coded as PIO1 RX for now
-
+        # One DMA channel per buffer - each is chained to the other so completing one frame starts receiving the next
+        self._dmas      = (dma.DmaChannel(dmachannel), dma.DmaChannel(chain_dmachannel))
+        for channel, sibling in ((self._dmas[0], chain_dmachannel), (self._dmas[1], dmachannel)):
+            channel.NoReadIncr()
+            channel.SetTREQ(dma.TREQ_PIO1_RX) # TODO hard coded as PIO1 RX for now
+            channel.SetChainTo(sibling)
 
     def start(self):
-        self._dma.SetChannelData(0x50200027, addressof(self.channels), len(self.channels), True) # TODO Hard coded as PIO1 RX +3 (LSB byte without shifting)
+        while self._sm.rx_fifo():               # Discard bytes left over from before pause() so the frame starts aligned
+            self._sm.get()
+
+        # Publish _buffers[1] again so the restarted DMA (into _buffers[0]) never writes to the frame readers hold, and
+        # hold the lock so wait_frame() waits for a fresh frame
+        self._active = 0
+        self.channels = self._buffers[1]
+        self._view = self._views[1]
+        self._frame_lock.acquire(0)
+        self._notify_pending = False
+
+        # Arm the idle channel without triggering it - it is started by the chain from the active one
+        waiting = self._dmas[1]
+        waiting.SetChannelData(_PIO0_RXF1_BYTE3, self._addrs[1], len(self.channels), False) # TODO Hard coded as statemachine 1
+        waiting.SetControlRegister(waiting.ControlValue)
+        self._dmas[0].SetChannelData(_PIO0_RXF1_BYTE3, self._addrs[0], len(self.channels), True)
         self._sm.restart()
         self._sm.put(len(self.channels)-1)    # Set the length of the DMX frame we expect
         self._sm.active(1)
     
     def pause(self):
+        # Stop the PIO first so nothing more arrives in the FIFO, then abort both channels - otherwise the one still armed
+        # picks up where it left off once start() re-triggers the other
         self._sm.active(0)
+        for channel in self._dmas:
+            channel.Abort()
+
+    @property
+    def frames_received(self):
+        """ The number of frames received since the receiver was created """
+        return self._frames[0]
+
+    def buffer(self):
+        """ Zero-copy access to the last complete frame
+
+        Returns:
+            memoryview: A view straight onto the DMA target holding the last complete frame, start code first. As with 
+                        `channels`, fetch it again for each frame.
+        """
+        return self._view
+
+    def wait_frame(self, timeout_ms=-1):
+        """ Sleep until a new frame has been received
+
+        Args:
+            timeout_ms (int, optional):     Give up after this many milliseconds. Defaults to -1 (wait forever).
+
+        Returns:
+            bool: True if a new frame arrived, False if the timeout expired first
+        """
+        start = utime.ticks_ms()
+        while not self._frame_lock.acquire(0):
+            if timeout_ms >= 0 and utime.ticks_diff(utime.ticks_ms(), start) >= timeout_ms:
+                return False
+            idle()                                      # WFE until the next interrupt rather than spinning
+        return True
 
     def __del__(self):
         # TODO - tidy up the state machine and DMA channels
@@ -221,30 +404,32 @@ class DMX_RX:
         pass
 
     def __str__(self):
-        result = ""
-
-        for chan in range(len(self.channels)):
-            if chan % 20 == 1:
-                result += f"\n{chan:03}:"                      # Start a new line with the channel number every 20 lines
-            
-            if chan % 5 == 1:
-                result += "  "                                 # Put spaces into the line every five channels
-            
-            if chan == 0:
-                result = f"Start code: {self.channels[chan]}"  # The start code ("channel zero") is formatted differently
-            else:
-                result += f"{self.channels[chan]:3}"
-            
-            if chan % 100 == 0:                                # Blank line every 100 channels
-                result += "\n"
-        
-        result += "\n"
-        return result
+        return _format_universe(self.channels, self._strbuf, 3)
     
     def IRQ_from_PIO(self, sm):
-        # When a byte of data is received, use DMA copy into a memory mapped channel variable
-        self._dma.SetChannelData(0x50200027, addressof(self.channels), len(self.channels), True) # TODO Hard coded as PIO1 RX
-        self.frames_received += 1
+        # Runs as a hard interrupt, so must not allocate - everything here works on preallocated objects and small ints
+        # A full frame has already chained the DMA over to the sibling channel and buffer, so just publish the frame received
+        filled = self._active
+        self._active = filled ^ 1
+        filled_dma = self._dmas[filled]
+
+        if filled_dma.Busy():
+            # Short frame - the DMA never reached the end of its buffer so didn't chain. Swap over by hand.
+            filled_dma.Abort()
+            self._dmas[self._active].Rearm(self._addrs[self._active])
+
+        filled_dma.SetWriteAddress(self._addrs[filled])  # Re-seed the now idle channel ready for its next turn
+        self.channels = self._buffers[filled]
+        self._view = self._views[filled]
+        _count_frame(self._frames)
+        if self._frame_lock.locked() and not self._notify_pending:
+            self._notify_pending = True
+            micropython.schedule(self._notify_ref, 0)   # Keep the handler short - wake any waiter from the scheduler
+
+    def _notify(self, _):
+        self._notify_pending = False
+        if self._frame_lock.locked():
+            self._frame_lock.release()
 
 
 def test_rx():
@@ -252,21 +437,17 @@ def test_rx():
     # Initialise the DMX receiver
     dmx_start = 0
 
-    dmx_in = DMX_RX(pin=28, statemachine=1)  # DMX data should be presented to GPIO28 (Pico pin 34)
+    dmx_in = DMX_RX(pin=28, statemachine=1, num_channels=dmx_start + 5)  # DMX data should be presented to GPIO28 (Pico pin 34)
     dmx_in.start()
-    last_frame = -1
+
+    # Hoist lookups out of the loop - buffer() can't be, as it changes with every frame
+    wait_frame = dmx_in.wait_frame
+    dmx_end = dmx_start + 6
 
     while True:
-        brightness = dmx_in.channels[dmx_start + 0]
-        red = dmx_in.channels[dmx_start + 1]
-        green = dmx_in.channels[dmx_start + 2]
-        blue = dmx_in.channels[dmx_start + 3]
-        fade = dmx_in.channels[dmx_start + 4]
-        speed = dmx_in.channels[dmx_start + 5]
-
-        current_frame = dmx_in.frames_received
-
-        if (current_frame != last_frame):
-            last_frame = current_frame
-            print(f"Received fader:{brightness}  R:{red} G:{green} B:{blue} B:{fade} B:{speed}")
+        wait_frame()
+
+        brightness, red, green, blue, fade, speed = dmx_in.buffer()[dmx_start:dmx_end]
+
+        print(f"Received fader:{brightness}  R:{red} G:{green} B:{blue} B:{fade} B:{speed}")
 
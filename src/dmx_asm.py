@@ -1,6 +1,15 @@
 #type: ignore
 
 import rp2
+import sys
+from array import array
+from micropython import const
+
+# Source for the PIO programs used by dmx.py. These are not assembled at run time - dmx.py uses the pre-assembled copies in
+# dmx_prog.py. After changing a program here, run print_programs() on a Pico and save the output as dmx_prog.py.
+#
+# dmx_in is written with its debug side-set. print_programs() also produces the release version of it, with the side-set
+# stripped out.
 
 @rp2.asm_pio(sideset_init=(rp2.PIO.OUT_HIGH, rp2.PIO.OUT_HIGH),
              in_shiftdir=rp2.PIO.SHIFT_RIGHT, 
@@ -76,15 +85,27 @@ def dmx_in():
     wrap()
 
 
-@staticmethod
 @rp2.asm_pio(sideset_init=rp2.PIO.OUT_HIGH, 
              autopull=False, 
              out_init=rp2.PIO.OUT_HIGH, 
              out_shiftdir=rp2.PIO.SHIFT_RIGHT)
 def dmx_out():
-    # Stall with line IDLE until the DMA transfer begins
-    pull()                  .side(1)         
-    
+    # Read the frame config - (bytes - 1) << 16 | inter-frame gap - into the OSR and park it in the ISR, which is otherwise 
+    # unused. This is only read once and re-used for every frame
+    pull()
+    mov(isr, osr)
+
+    # Hold the line IDLE between frames for the gap - (gap + 1) * 8us
+    wrap_target()
+    mov(osr, isr)           .side(1)
+    out(x, 16)
+
+    label("gaploop")
+    jmp(x_dec, "gaploop")               [7]
+
+    # Load the byte counter for this frame
+    out(y, 16)
+
     # Assert BREAK for 176us (=22*(1+7)us)
     set(x, 21)              .side(0)         
     
@@ -95,9 +116,10 @@ def dmx_out():
     nop()                   .side(1)    [7]  
     nop()                               [7]   
     
-    # Send data frame - OSR already has the first byte in it from earlier PULL
-    wrap_target()                            
-    
+    # Stall with line IDLE until the DMA provides the next byte
+    label("byteloop")
+    pull()
+
     # Send START bit (4us) and load the bit counter
     set(x, 7)               .side(0)    [3]  
     
@@ -106,6 +128,74 @@ def dmx_out():
     out(pins, 1)                             
     jmp(x_dec, "bitloop")               [2]
 
-    # Send 2 STOP bits (8us), or stall with line in idle state
-    pull()                  .side(1)    [7]  
-    wrap()                                    
+    # Send 2 STOP bits (8us), then go back for the next byte until the whole frame has been sent
+    jmp(y_dec, "byteloop")  .side(1)    [7]  
+    wrap()
+
+
+_WORDS_PER_LINE = const(12)
+
+# @rp2.asm_pio returns [instructions, <one load offset per PIO block>, EXECCTRL, SHIFTCTRL, out_init, set_init, sideset_init].
+# The fields after the offsets are counted from the end, so the number of offsets doesn't matter.
+_EXECCTRL       = const(-5)
+_SIDESET_INIT   = const(-1)
+_PIN_INIT       = const(-3)                         # out_init, set_init and sideset_init are pin states, the rest hex words
+
+_PIN_STATES     = ("IN_LOW", "IN_HIGH", "OUT_LOW", "OUT_HIGH")
+
+_HEADER = """#type: ignore
+
+import rp2
+from array import array
+
+# Pre-assembled PIO programs for dmx.py, so the PIO assembler doesn't have to run (and allocate) at every boot.
+#
+# Generated by dmx_asm.print_programs() on MicroPython %s. The source for these programs is in dmx_asm.py - after
+# changing it, or moving to a MicroPython release with a different @rp2.asm_pio layout, run print_programs() on a Pico
+# and save the output as this file.
+#
+# Each program has the same layout as the list returned by @rp2.asm_pio, which is what rp2.StateMachine expects:
+#     [instructions, PIO0 offset, PIO1 offset, EXECCTRL, SHIFTCTRL, out_init, set_init, sideset_init]
+# The offsets are filled in by rp2 when the program is first loaded into a PIO."""
+
+def _literal(value, pin_state):
+    # Source text for one field of an assembled program
+    if value is None:
+        return "None"
+    if isinstance(value, tuple):
+        return "(%s)" % ", ".join(_literal(item, pin_state) for item in value)
+    if pin_state:
+        for name in _PIN_STATES:
+            if value == getattr(rp2.PIO, name):
+                return "rp2.PIO." + name
+    return "0x%08x" % value
+
+def _format_program(name, prog):
+    # name = [array('H', [...]), <fields>] wrapped to match dmx_prog.py
+    words = ["0x%04x" % word for word in prog[0]]
+    lines = [", ".join(words[i:i + _WORDS_PER_LINE]) for i in range(0, len(words), _WORDS_PER_LINE)]
+    fields = prog[1:]
+    offsets = len(fields) + _EXECCTRL
+    text = ["-1"] * offsets                         # Reset - the copy in dmx_prog.py starts out not loaded into any PIO
+    text += [_literal(field, i >= len(fields) + _PIN_INIT) for i, field in enumerate(fields) if i >= offsets]
+
+    opening = "%s = [array('H', [" % name
+    return (opening + (",\n" + " " * len(opening)).join(lines) + "]),\n"
+            + " " * (len(name) + 4) + ", ".join(text) + "]")
+
+def print_programs():
+    """ Print dmx_prog.py - the assembled programs in the form rp2.StateMachine accepts """
+    # Release dmx_in: clear side-set enable and value (bits 12-10) leaving the delays (bits 9-8), and drop SIDE_EN from EXECCTRL
+    dmx_in_release = list(dmx_in)
+    dmx_in_release[0] = array('H', [word & ~0x1C00 for word in dmx_in[0]])
+    dmx_in_release[_EXECCTRL] &= ~(1 << 30)
+    dmx_in_release[_SIDESET_INIT] = None
+
+    print(_HEADER % ".".join(str(part) for part in sys.implementation.version[:3]))
+    print()
+    print(_format_program("dmx_in", dmx_in_release))
+    print()
+    print("# dmx_in with the debug side-set on two pins - see dmx_asm.py for what each side-set value means")
+    print(_format_program("dmx_in_debug", dmx_in))
+    print()
+    print(_format_program("dmx_out", dmx_out))
@@ -0,0 +1,27 @@
+#type: ignore
+
+import rp2
+from array import array
+
+# Pre-assembled PIO programs for dmx.py, so the PIO assembler doesn't have to run (and allocate) at every boot.
+#
+# Generated by dmx_asm.print_programs() on MicroPython 1.19.1. The source for these programs is in dmx_asm.py - after
+# changing it, or moving to a MicroPython release with a different @rp2.asm_pio layout, run print_programs() on a Pico
+# and save the output as this file.
+#
+# Each program has the same layout as the list returned by @rp2.asm_pio, which is what rp2.StateMachine expects:
+#     [instructions, PIO0 offset, PIO1 offset, EXECCTRL, SHIFTCTRL, out_init, set_init, sideset_init]
+# The offsets are filled in by rp2 when the program is first loaded into a PIO.
+
+dmx_in = [array('H', [0x80a0, 0xe03d, 0x01c1, 0x0042, 0xa047, 0x20a0, 0x2220, 0xe227, 0x4001, 0x0248, 0x00ce, 0xc010,
+                      0xe02f, 0x0002, 0x8000, 0x0086, 0xc010]),
+          -1, -1, 0x00010080, 0x00040000, None, None, None]
+
+# dmx_in with the debug side-set on two pins - see dmx_asm.py for what each side-set value means
+dmx_in_debug = [array('H', [0x80a0, 0xfc3d, 0x01c1, 0x1842, 0xb047, 0x20a0, 0x2220, 0xe227, 0x5401, 0x0248, 0x00ce, 0xc010,
+                            0xe02f, 0x0002, 0x9000, 0x0086, 0xc010]),
+                -1, -1, 0x40010080, 0x00040000, None, None, (rp2.PIO.OUT_HIGH, rp2.PIO.OUT_HIGH)]
+
+dmx_out = [array('H', [0x80a0, 0xa0c7, 0xb8e6, 0x6030, 0x0744, 0x6050, 0xf035, 0x0747, 0xbf42, 0xa742, 0x80a0, 0xf327,
+                       0x6001, 0x024c, 0x1f8a]),
+           -1, -1, 0x4000e100, 0x00080000, rp2.PIO.OUT_HIGH, None, rp2.PIO.OUT_HIGH]
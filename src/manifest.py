@@ -0,0 +1,7 @@
+# Freezes the DMX driver into the MicroPython firmware, so its bytecode runs straight from flash instead of being compiled
+# into RAM at every boot. Build from the MicroPython source tree with:
+#     make -C ports/rp2 BOARD=RPI_PICO FROZEN_MANIFEST=/path/to/PicoPannel/src/manifest.py
+
+include("$(PORT_DIR)/boards/manifest.py")
+
+freeze(".", ("dma.py", "dmx.py", "dmx_prog.py"))